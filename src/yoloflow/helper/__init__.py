@@ -1,5 +1,7 @@
-from .create_project_helper import initialize_project
+from .create_project_helper import initialize_project, import_datasets, add_pretrained_models
 
 __all__ = [
-    "initialize_project"
+    "initialize_project",
+    "import_datasets",
+    "add_pretrained_models"
 ]
\ No newline at end of file
@@ -45,6 +45,13 @@ GITHUB_ASSETS_TAG = "v8.3.0"
 
 def initialize_project(project: Project, datasets: list[DatasetInfo], models: list[ModelInfo], parent_widget=None) -> Project:
     """帮助快速的创建项目，并自动添加数据集和预训练模型"""
+    import_datasets(project, datasets)
+    add_pretrained_models(project, datasets, models, parent_widget)
+    return project
+
+
+def import_datasets(project: Project, datasets: list[DatasetInfo]) -> None:
+    """将数据集导入项目（只涉及文件操作，可以在工作线程中执行）"""
     for dataset in datasets:
         project.dataset_manager.import_dataset(
             source_path=dataset.path,
@@ -53,6 +60,9 @@ def initialize_project(project: Project, datasets: list[DatasetInfo], models: li
             description=dataset.description
         )
 
+
+def add_pretrained_models(project: Project, datasets: list[DatasetInfo], models: list[ModelInfo], parent_widget=None) -> None:
+    """添加预训练模型并为其创建训练计划（可能弹出下载对话框，必须在GUI线程中执行）"""
     for model in models:
         # 先检查本地是否有缓存
         local_file = Path.cwd().joinpath('pretrained').joinpath(model.filename)
@@ -91,8 +101,6 @@ def initialize_project(project: Project, datasets: list[DatasetInfo], models: li
             
         project.save_config()
 
-    return project
-
 
 def _download_model_with_dialog(download_url: str, output_path: Path, filename: str, parent_widget=None) -> bool:
     """通过对话框下载模型"""
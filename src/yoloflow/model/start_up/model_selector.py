@@ -28,6 +28,8 @@ class ModelSelector:
         """
         self._backend_manager = backend_manager
         self._models: List[ModelInfo] = []
+        # Per-task lookup cache, invalidated whenever the registry changes
+        self._task_models_cache: Dict[TaskType, List[ModelInfo]] = {}
         self._register_default_models()
         if self._backend_manager:
             self._sync_from_backend_manager()
@@ -250,6 +252,7 @@ class ModelSelector:
             # Backend models are added directly (they have from_backend field)
             # They may have the same filename as default models but provide backend-specific functionality
             self._models.append(model)
+        self._task_models_cache.clear()
     
     def set_backend_manager(self, backend_manager: 'BackendManager'):
         """Set backend manager and sync models.
@@ -265,6 +268,7 @@ class ModelSelector:
         if self._backend_manager:
             # Remove existing backend models first
             self._models = [m for m in self._models if not m.from_backend]
+            self._task_models_cache.clear()
             # Add current backend models
             self._sync_from_backend_manager()
     
@@ -283,6 +287,7 @@ class ModelSelector:
                 break
         
         self._models.append(model_info)
+        self._task_models_cache.clear()
     
     def get_models_for_task(self, task_type: TaskType) -> List[ModelInfo]:
         """
@@ -294,7 +299,11 @@ class ModelSelector:
         Returns:
             List of models supporting the task type
         """
-        return [model for model in self._models if model.supports_task(task_type)]
+        models = self._task_models_cache.get(task_type)
+        if models is None:
+            models = [model for model in self._models if model.supports_task(task_type)]
+            self._task_models_cache[task_type] = models
+        return models.copy()
     
     def get_model_by_filename(self, filename: str) -> Optional[ModelInfo]:
         """
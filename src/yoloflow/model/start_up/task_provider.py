@@ -24,6 +24,8 @@ class TaskTypeProvider:
     def __init__(self):
         """Initialize task type provider with default task information."""
         self._tasks: Dict[TaskType, TaskInfo] = {}
+        # Ordered task list cache, invalidated whenever the registry changes
+        self._all_tasks: Optional[List[TaskInfo]] = None
         self._register_default_tasks()
     
     def _register_default_tasks(self):
@@ -84,6 +86,7 @@ class TaskTypeProvider:
             task_info: Task information to register
         """
         self._tasks[task_info.task_type] = task_info
+        self._all_tasks = None
     
     def get_task_info(self, task_type: TaskType) -> Optional[TaskInfo]:
         """
@@ -104,6 +107,12 @@ class TaskTypeProvider:
         Returns:
             List of all task information in registration order
         """
+        if self._all_tasks is None:
+            self._all_tasks = self._build_ordered_tasks()
+        return self._all_tasks.copy()
+    
+    def _build_ordered_tasks(self) -> List[TaskInfo]:
+        """Build the ordered task list returned by get_all_tasks."""
         # Return in a specific order for UI consistency
         ordered_types = [
             TaskType.CLASSIFICATION,
@@ -215,6 +224,7 @@ class TaskTypeProvider:
         """
         if task_type in self._tasks:
             del self._tasks[task_type]
+            self._all_tasks = None
     
     def __str__(self) -> str:
         return f"TaskTypeProvider({self.get_task_count()} tasks registered)"
@@ -3,121 +3,102 @@ UI工具函数，提供统一的深色主题MessageBox
 """
 
 from PySide6.QtWidgets import QMessageBox, QWidget
-from typing import Optional
+from shiboken6 import isValid
+from typing import Dict, Optional
 
 
-def show_warning_message(parent: Optional[QWidget], title: str, message: str) -> None:
-    """显示样式化的警告对话框"""
-    msg_box = QMessageBox(parent)
-    msg_box.setIcon(QMessageBox.Icon.Warning)
+# 深色主题样式：各类型对话框共用，通过severity属性切换按钮的强调色
+_MESSAGE_BOX_QSS = """
+    QMessageBox {
+        background-color: #2b2b2b;
+        color: white;
+        border: 1px solid #666;
+    }
+    QMessageBox QLabel {
+        color: white;
+        font-size: 12px;
+    }
+    QMessageBox QPushButton {
+        background-color: #007ACC;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QMessageBox QPushButton:hover {
+        background-color: #005999;
+    }
+    QMessageBox QPushButton:pressed {
+        background-color: #004477;
+    }
+    QMessageBox[severity="critical"] QPushButton {
+        background-color: #dc3545;
+    }
+    QMessageBox[severity="critical"] QPushButton:hover {
+        background-color: #c82333;
+    }
+    QMessageBox[severity="critical"] QPushButton:pressed {
+        background-color: #bd2130;
+    }
+    QMessageBox[severity="information"] QPushButton {
+        background-color: #28a745;
+    }
+    QMessageBox[severity="information"] QPushButton:hover {
+        background-color: #218838;
+    }
+    QMessageBox[severity="information"] QPushButton:pressed {
+        background-color: #1e7e34;
+    }
+"""
+
+
+# 每种类型缓存一个对话框，重复弹出时只更新标题和内容
+_message_boxes: Dict[str, QMessageBox] = {}
+
+
+def _get_message_box(parent: Optional[QWidget], icon: QMessageBox.Icon,
+                     severity: str) -> QMessageBox:
+    """获取指定类型的对话框，必要时创建新的实例"""
+    msg_box = _message_boxes.get(severity)
+
+    # 父窗口销毁时对话框会随之销毁；正在显示时（嵌套弹出）也不能复用
+    if msg_box is None or not isValid(msg_box) or msg_box.isVisible():
+        msg_box = QMessageBox(parent)
+        msg_box.setIcon(icon)
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # 先设置severity属性，再应用共用的深色主题样式
+        msg_box.setProperty("severity", severity)
+        msg_box.setStyleSheet(_MESSAGE_BOX_QSS)
+        _message_boxes[severity] = msg_box
+    elif msg_box.parentWidget() is not parent:
+        # 保留对话框的窗口标志，仅更换父窗口
+        msg_box.setParent(parent, msg_box.windowFlags())
+
+    return msg_box
+
+
+def _show_message(parent: Optional[QWidget], icon: QMessageBox.Icon, severity: str,
+                  title: str, message: str) -> None:
+    """显示样式化的对话框"""
+    msg_box = _get_message_box(parent, icon, severity)
     msg_box.setWindowTitle(title)
     msg_box.setText(message)
-    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-    
-    # 设置深色主题样式
-    msg_box.setStyleSheet("""
-        QMessageBox {
-            background-color: #2b2b2b;
-            color: white;
-            border: 1px solid #666;
-        }
-        QMessageBox QLabel {
-            color: white;
-            font-size: 12px;
-        }
-        QMessageBox QPushButton {
-            background-color: #007ACC;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            padding: 8px 16px;
-            font-weight: bold;
-            min-width: 80px;
-        }
-        QMessageBox QPushButton:hover {
-            background-color: #005999;
-        }
-        QMessageBox QPushButton:pressed {
-            background-color: #004477;
-        }
-    """)
-    
     msg_box.exec()
 
 
+def show_warning_message(parent: Optional[QWidget], title: str, message: str) -> None:
+    """显示样式化的警告对话框"""
+    _show_message(parent, QMessageBox.Icon.Warning, "warning", title, message)
+
+
 def show_critical_message(parent: Optional[QWidget], title: str, message: str) -> None:
-    """显示样式化的错误对话框"""
-    msg_box = QMessageBox(parent)
-    msg_box.setIcon(QMessageBox.Icon.Critical)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-    
-    # 设置深色主题样式（错误用红色强调）
-    msg_box.setStyleSheet("""
-        QMessageBox {
-            background-color: #2b2b2b;
-            color: white;
-            border: 1px solid #666;
-        }
-        QMessageBox QLabel {
-            color: white;
-            font-size: 12px;
-        }
-        QMessageBox QPushButton {
-            background-color: #dc3545;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            padding: 8px 16px;
-            font-weight: bold;
-            min-width: 80px;
-        }
-        QMessageBox QPushButton:hover {
-            background-color: #c82333;
-        }
-        QMessageBox QPushButton:pressed {
-            background-color: #bd2130;
-        }
-    """)
-    
-    msg_box.exec()
+    """显示样式化的错误对话框（错误用红色强调）"""
+    _show_message(parent, QMessageBox.Icon.Critical, "critical", title, message)
 
 
 def show_information_message(parent: Optional[QWidget], title: str, message: str) -> None:
-    """显示样式化的信息对话框"""
-    msg_box = QMessageBox(parent)
-    msg_box.setIcon(QMessageBox.Icon.Information)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-    
-    # 设置深色主题样式（信息用绿色强调）
-    msg_box.setStyleSheet("""
-        QMessageBox {
-            background-color: #2b2b2b;
-            color: white;
-            border: 1px solid #666;
-        }
-        QMessageBox QLabel {
-            color: white;
-            font-size: 12px;
-        }
-        QMessageBox QPushButton {
-            background-color: #28a745;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            padding: 8px 16px;
-            font-weight: bold;
-            min-width: 80px;
-        }
-        QMessageBox QPushButton:hover {
-            background-color: #218838;
-        }
-        QMessageBox QPushButton:pressed {
-            background-color: #1e7e34;
-        }
-    """)
-    
-    msg_box.exec()
+    """显示样式化的信息对话框（信息用绿色强调）"""
+    _show_message(parent, QMessageBox.Icon.Information, "information", title, message)
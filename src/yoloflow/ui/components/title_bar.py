@@ -9,6 +9,36 @@ from PySide6.QtGui import QMouseEvent
 from ...__version__ import __version__
 
 
+# 标题栏样式：在标题栏上设置一次，标题和关闭按钮通过objectName匹配
+_TITLE_BAR_QSS = """
+    CustomTitleBar {
+        background-color: #2c3e50;
+        border-bottom: 1px solid #34495e;
+    }
+    QLabel#titleBarLabel {
+        color: #ecf0f1;
+        font-size: 14px;
+        font-weight: bold;
+        background: transparent;
+    }
+    QPushButton#titleBarCloseBtn {
+        background-color: transparent;
+        color: #bdc3c7;
+        border: none;
+        font-size: 18px;
+        font-weight: bold;
+        border-radius: 4px;
+    }
+    QPushButton#titleBarCloseBtn:hover {
+        background-color: #e74c3c;
+        color: white;
+    }
+    QPushButton#titleBarCloseBtn:pressed {
+        background-color: #c0392b;
+    }
+"""
+
+
 class CustomTitleBar(QWidget):
     """自定义标题栏"""
     
@@ -25,12 +55,7 @@ class CustomTitleBar(QWidget):
     def _setup_ui(self):
         """设置标题栏UI"""
         self.setFixedHeight(40)
-        self.setStyleSheet("""
-            CustomTitleBar {
-                background-color: #2c3e50;
-                border-bottom: 1px solid #34495e;
-            }
-        """)
+        self.setStyleSheet(_TITLE_BAR_QSS)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(15, 0, 10, 0)
@@ -38,14 +63,7 @@ class CustomTitleBar(QWidget):
         
         # 应用名称和版本号
         title_label = QLabel(self.title)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #ecf0f1;
-                font-size: 14px;
-                font-weight: bold;
-                background: transparent;
-            }
-        """)
+        title_label.setObjectName("titleBarLabel")
         layout.addWidget(title_label)
         
         # 弹性空间
@@ -54,23 +72,7 @@ class CustomTitleBar(QWidget):
         # 关闭按钮
         self.close_btn = QPushButton("×")
         self.close_btn.setFixedSize(40, 30)  # 4:3比例
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #bdc3c7;
-                border: none;
-                font-size: 18px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #e74c3c;
-                color: white;
-            }
-            QPushButton:pressed {
-                background-color: #c0392b;
-            }
-        """)
+        self.close_btn.setObjectName("titleBarCloseBtn")
         self.close_btn.clicked.connect(self.close_clicked.emit)
         self.close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         layout.addWidget(self.close_btn)
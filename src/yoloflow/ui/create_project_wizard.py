@@ -4,28 +4,220 @@ Create New Project Wizard.
 创建新项目向导窗口，包含Tab布局的多步骤项目配置界面。
 """
 
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional, Set
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit,
-    QTextEdit, QFileDialog, QTabWidget, QGridLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QDialog, QFormLayout, QComboBox,
-    QSpacerItem, QSizePolicy, QScrollArea, QFrame, QButtonGroup,
-    QRadioButton, QMessageBox, QMainWindow, QCheckBox
+    QPlainTextEdit, QFileDialog, QTabWidget, QGridLayout, QTableWidget,
+    QTableWidgetItem, QHeaderView, QDialog, QFormLayout,
+    QScrollArea, QFrame, QButtonGroup,
+    QRadioButton, QMessageBox, QMainWindow, QCheckBox, QAbstractButton
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QPalette, QColor
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QThread
 
-
-
-from ..model.enums import TaskType, DatasetType
-from ..model.start_up import TaskTypeProvider, ModelSelector,ModelInfo
-from ..model.project import DatasetInfo
-from ..helper import initialize_project
+from ..model.enums import TaskType
+from ..model.start_up import TaskTypeProvider, ModelSelector, ModelInfo
+from ..model.project import DatasetInfo, Project
+from ..helper import import_datasets, add_pretrained_models
 from .components import CustomTitleBar
 from .dataset_config_dialog import DatasetConfigDialog
-from ..__version__ import __version__
+
+
+# 页面标题样式（字体直接由样式表指定，无需额外设置QFont）
+_TITLE_QSS = "color: white; font: bold 16px 'Arial'; margin-bottom: 10px;"
+
+# 任务类型卡片样式：在卡片容器上设置一次，所有卡片共享同一份解析结果
+_TASK_CARD_QSS = """
+    QFrame#taskCard {
+        border: 2px solid #303030;
+        border-radius: 8px;
+        background-color: #303030;
+        padding: 0px;
+        color: white;
+    }
+    QFrame#taskCard:hover {
+        border-color: #007ACC;
+    }
+    QLabel#taskCardTitle {
+        color: white;
+        font: bold 12pt 'Arial';
+        border: none;
+    }
+    QLabel#taskCardDesc {
+        color: #aaa;
+        font-size: 12px;
+        border: none;
+    }
+    QRadioButton {
+        font-weight: bold;
+    }
+    QRadioButton::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QRadioButton::indicator:unchecked {
+        border: 2px solid #ddd;
+        background-color: transparent;
+        border-radius: 9px;
+    }
+    QRadioButton::indicator:checked {
+        border: 2px solid #007ACC;
+        background-color: #007ACC;
+        border-radius: 9px;
+    }
+"""
+
+# 按钮样式：由窗口和内容区域的样式表统一下发给所有按钮
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: #007ACC;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #005999;
+    }
+    QPushButton:disabled {
+        background-color: #666;
+    }
+    QPushButton#deleteBtn {
+        background-color: #dc3545;
+        padding: 5px 10px;
+    }
+    QPushButton#deleteBtn:hover {
+        background-color: #c82333;
+    }
+"""
+
+# 向导窗口样式
+_WIZARD_QSS = """
+    QMainWindow {
+        background-color: #2b2b2b;
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+    }
+""" + _BUTTON_QSS
+
+# 输入框样式
+_INPUT_QSS = """
+    QLineEdit, QPlainTextEdit {
+        background-color: #363636;
+        color: white;
+        border: 2px solid #999;
+        border-radius: 4px;
+        padding: 5px;
+    }
+"""
+
+# 项目完整路径预览样式：通过动态属性state切换状态，无需重新设置样式表
+_FULL_PATH_QSS = """
+    QLabel {
+        color: #aaa;
+        background-color: #363636;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 8px;
+        margin-top: 10px;
+        font-weight: bold;
+    }
+    QLabel[state="ok"] {
+        color: #007ACC;
+        border-color: #007ACC;
+    }
+"""
+
+# 已选择模型数量提示样式
+_MODEL_COUNT_QSS = """
+    QLabel {
+        color: #aaa;
+        margin-bottom: 10px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QLabel[state="ok"] {
+        color: #007ACC;
+    }
+"""
+
+# 模型列表样式：在列表容器上设置一次，所有模型多选框和描述共享
+_MODEL_LIST_QSS = """
+    QCheckBox {
+        color: white;
+        padding: 5px;
+        font-weight: bold;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:unchecked {
+        border: 2px solid #ddd;
+        background-color: #2b2b2b;
+        border-radius: 4px;
+    }
+    QCheckBox::indicator:checked {
+        border: 2px solid #007ACC;
+        background-color: #007ACC;
+        border-radius: 4px;
+    }
+    QLabel#modelDesc {
+        color: #aaa;
+        font-size: 11px;
+        margin-left: 20px;
+        margin-bottom: 10px;
+    }
+"""
+
+# 用户主目录，作为文件对话框的默认起始目录
+_HOME_DIR = str(Path.home())
+
+
+class CreateProjectWorker(QThread):
+    """在后台线程中创建项目目录并导入数据集"""
+
+    succeeded = Signal(object)  # 项目文件创建完成信号，参数为Project
+    failed = Signal(str)        # 创建失败信号，参数为错误信息
+
+    def __init__(self, project_path: Path, project_name: str, task_type: TaskType,
+                 description: str, datasets: List[DatasetInfo], parent=None):
+        super().__init__(parent)
+        self.project_path = project_path
+        self.project_name = project_name
+        self.task_type = task_type
+        self.description = description
+        self.datasets = list(datasets)
+
+    def run(self):
+        """创建项目并导入数据集"""
+        try:
+            project = Project.create_new(
+                project_path=str(self.project_path),
+                project_name=self.project_name,
+                task_type=self.task_type,
+                description=self.description
+            )
+            import_datasets(project, self.datasets)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(project)
+
+
+class TaskCard(QFrame):
+    """任务类型卡片"""
+
+    clicked = Signal()  # 点击卡片信号
+
+    def mousePressEvent(self, event):
+        """鼠标点击事件"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
 
 
 class CreateProjectWizard(QMainWindow):
@@ -41,15 +233,34 @@ class CreateProjectWizard(QMainWindow):
 
         # 存储用户选择的数据
         self.selected_task_type: Optional[TaskType] = None
-        self.project_name: str = ""
-        self.project_description: str = ""
-        self.project_path: str = ""
         self.datasets: List[DatasetInfo] = []
-        self.selected_models: List[ModelInfo] = []
+        # 已选择的模型，按文件名索引（与ModelSelector的去重规则一致），保持选择顺序
+        self._selected_models: Dict[str, ModelInfo] = {}
         
-        # 用于跟踪模型列表是否需要更新
-        self._last_task_type: Optional[TaskType] = None
-        self._model_list_initialized = False
+        # 模型列表控件缓存：按任务类型复用已创建的控件，切换时仅切换可见性
+        self._model_widgets_by_task: Dict[TaskType, List[QWidget]] = {}
+        self._current_model_task: Optional[TaskType] = None
+
+        # 上次浏览选择的目录
+        self._last_browse_dir: str = _HOME_DIR
+
+        # 数据集配置对话框（首次添加时创建，之后复用）
+        self._dataset_dialog: Optional[DatasetConfigDialog] = None
+
+        # 已选择模型数量提示（模型配置页面创建后才存在）
+        self.selected_models_label: Optional[QLabel] = None
+
+        # 上一次应用到底部按钮的状态，未变化时跳过按钮更新
+        self._last_button_state: Optional[tuple] = None
+
+        # 后台创建项目的工作线程（创建期间不为None）
+        self._create_worker: Optional[CreateProjectWorker] = None
+
+        # 项目信息变更防抖定时器：连续输入停顿后才刷新一次状态
+        self._state_timer = QTimer(self)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(100)
+        self._state_timer.timeout.connect(self._on_project_info_changed)
 
         self._setup_ui()
         self._setup_styles()
@@ -73,29 +284,39 @@ class CreateProjectWizard(QMainWindow):
 
         # 自定义标题栏
         self.title_bar = CustomTitleBar(self, "创建新项目")
-        self.title_bar.close_clicked.connect(self.close)
+        self.title_bar.close_clicked.connect(
+            self.close, Qt.ConnectionType.QueuedConnection)
         main_layout.addWidget(self.title_bar)
 
         # 内容区域
         content_widget = QWidget()
         content_layout = QHBoxLayout(content_widget)
         content_layout.setContentsMargins(20, 20, 20, 20)
+        # 内容区域的透明背景规则会覆盖窗口级样式，因此按钮和输入框规则也在此处下发
         content_widget.setStyleSheet("""
             QWidget {
                 background: transparent;
                 color: #ffffff;
             }
-        """)
+        """ + _BUTTON_QSS + _INPUT_QSS)
 
         # Tab布局
         self.tab_widget = QTabWidget()
         self.tab_widget.setTabPosition(QTabWidget.TabPosition.West)  # Tab在左侧
 
-        # 添加各个Tab页面
+        # 添加各个Tab页面（除首页外先放置空白页，首次进入时再创建内容）
         self._create_task_type_page()
-        self._create_project_info_page()
-        self._create_dataset_config_page()
-        self._create_model_config_page()
+        self.tab_widget.addTab(QWidget(), "项目信息")
+        self.tab_widget.addTab(QWidget(), "数据集配置")
+        self.tab_widget.addTab(QWidget(), "模型配置")
+        self._page_builders = {
+            1: self._build_project_info_page,
+            2: self._build_dataset_config_page,
+            3: self._build_model_config_page,
+        }
+        self._pages_built: Set[int] = set()
+        # Tab数量在创建后固定不变
+        self._total_tabs = self.tab_widget.count()
 
         content_layout.addWidget(self.tab_widget)
         main_layout.addWidget(content_widget)
@@ -117,9 +338,7 @@ class CreateProjectWizard(QMainWindow):
 
         # 标题
         title = QLabel("选择项目类型")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title.setStyleSheet(
-            "color: white; font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title)
 
         # 说明文字
@@ -132,10 +351,12 @@ class CreateProjectWizard(QMainWindow):
         # 滚动区域
         scroll_area = QScrollArea()
         scroll_widget = QWidget()
+        scroll_widget.setStyleSheet(_TASK_CARD_QSS)
         scroll_layout = QGridLayout(scroll_widget)
 
-        # 任务类型按钮组
-        self.task_button_group = QButtonGroup()
+        # 任务类型按钮组（所有单选按钮共用一个点击处理）
+        self.task_button_group = QButtonGroup(self)
+        self.task_button_group.buttonClicked.connect(self._on_task_button_clicked)
         tasks = self.task_provider.get_all_tasks()
 
         # 按网格布局排列任务类型卡片
@@ -148,6 +369,12 @@ class CreateProjectWizard(QMainWindow):
             card = self._create_task_card(task_info)
             scroll_layout.addWidget(card, row, col)
 
+        # 卡片尺寸固定，两列平分宽度，剩余高度留给末尾的空行，避免布局反复估算
+        scroll_layout.setColumnStretch(0, 1)
+        scroll_layout.setColumnStretch(1, 1)
+        scroll_layout.setRowStretch(rows, 1)
+        scroll_layout.setSpacing(8)
+
         scroll_area.setWidget(scroll_widget)
         scroll_area.setWidgetResizable(True)
         layout.addWidget(scroll_area)
@@ -157,21 +384,11 @@ class CreateProjectWizard(QMainWindow):
 
     def _create_task_card(self, task_info) -> QWidget:
         """创建任务类型卡片"""
-        card = QFrame()
+        # 卡片样式统一由滚动区域容器的样式表提供，这里只设置对象名
+        card = TaskCard()
+        card.setObjectName("taskCard")
         card.setFrameStyle(QFrame.Shape.Box)
         card.setFixedSize(300, 100)
-        card.setStyleSheet("""
-            QFrame {
-                border: 2px solid #303030;
-                border-radius: 8px;
-                background-color: #303030;
-                padding: 0px;
-                color: white;
-            }
-            QFrame:hover {
-                border-color: #007ACC;
-            }
-        """)
 
         layout = QVBoxLayout(card)
 
@@ -180,30 +397,10 @@ class CreateProjectWizard(QMainWindow):
         radio = QRadioButton()
         # 使用自定义属性存储任务类型
         radio.setProperty("task_type", task_info.task_type)
-        radio.setStyleSheet("""
-            QRadioButton {
-                font-weight: bold;
-            }
-            QRadioButton::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QRadioButton::indicator:unchecked {
-                border: 2px solid #ddd;
-                background-color: transparent;
-                border-radius: 9px;
-            }
-            QRadioButton::indicator:checked {
-                border: 2px solid #007ACC;
-                background-color: #007ACC;
-                border-radius: 9px;
-            }
-        """)
         self.task_button_group.addButton(radio)
 
         title = QLabel(task_info.name)
-        title.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        title.setStyleSheet("color: white; font-weight: bold; border: none;")
+        title.setObjectName("taskCardTitle")
 
         header_layout.addWidget(radio)
         header_layout.addWidget(title)
@@ -213,40 +410,35 @@ class CreateProjectWizard(QMainWindow):
 
         # 描述文字
         desc = QLabel(task_info.description)
+        desc.setObjectName("taskCardDesc")
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #aaa; font-size: 12px; border: none;")
         layout.addWidget(desc)
 
-        # 点击卡片选中单选按钮
-        def on_card_clicked():
-            radio.setChecked(True)
-            old_task_type = self.selected_task_type
-            self.selected_task_type = task_info.task_type
-            
-            # 只有在任务类型真正改变时才重置已选择的模型
-            if old_task_type != self.selected_task_type:
-                self.selected_models.clear()
-                self._last_task_type = self.selected_task_type
-                self._model_list_initialized = False  # 标记需要重新初始化模型列表
-                self._update_selected_models_display()
-            
-            self._update_button_state()
-
-        card.mousePressEvent = lambda e: on_card_clicked()
-        radio.clicked.connect(on_card_clicked)
+        # 点击卡片等同于点击单选按钮
+        card.clicked.connect(radio.click)
 
         return card
 
-    def _create_project_info_page(self):
+    @Slot(QAbstractButton)
+    def _on_task_button_clicked(self, button: QAbstractButton):
+        """任务类型单选按钮点击时的处理"""
+        old_task_type = self.selected_task_type
+        self.selected_task_type = button.property("task_type")
+
+        # 只有在任务类型真正改变时才重置已选择的模型
+        if old_task_type != self.selected_task_type:
+            self._selected_models.clear()
+            self._update_selected_models_display()
+
+        self._update_button_state()
+
+    def _build_project_info_page(self, page: QWidget):
         """创建项目信息页面"""
-        page = QWidget()
         layout = QVBoxLayout(page)
 
         # 标题
         title = QLabel("项目信息")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title.setStyleSheet(
-            "color: white; font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title)
 
         # 表单布局
@@ -257,38 +449,24 @@ class CreateProjectWizard(QMainWindow):
         # 项目名称
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("输入项目名称")
-        self.name_edit.textChanged.connect(self._on_project_info_changed)
+        self.name_edit.textChanged.connect(self._state_timer.start)
         form_layout.addRow("项目名称*:", self.name_edit)
 
         # 项目描述
-        self.description_edit = QTextEdit()
+        self.description_edit = QPlainTextEdit()
         self.description_edit.setPlaceholderText("输入项目描述（可选）")
         self.description_edit.setFixedHeight(100)
-        self.description_edit.textChanged.connect(
-            self._on_project_info_changed)
+        # 描述不影响路径预览和按钮状态，读取时再获取，无需监听变更
         form_layout.addRow("项目描述:", self.description_edit)
 
         # 项目路径
         path_layout = QHBoxLayout()
         self.path_edit = QLineEdit()
         self.path_edit.setPlaceholderText("选择项目保存路径")
-        self.path_edit.textChanged.connect(self._on_project_info_changed)
+        self.path_edit.textChanged.connect(self._state_timer.start)
 
         browse_button = QPushButton("浏览...")
         browse_button.clicked.connect(self._browse_project_path)
-        browse_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007ACC;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005999;
-            }
-        """)
 
         path_layout.addWidget(self.path_edit)
         path_layout.addWidget(browse_button)
@@ -299,36 +477,27 @@ class CreateProjectWizard(QMainWindow):
 
         # 项目完整路径预览 - 直接添加到主布局以占满宽度
         self.full_path_label = QLabel("请填写项目名称和路径")
-        self.full_path_label.setStyleSheet("""
-            QLabel {
-                color: #007ACC;
-                background-color: #363636;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 8px;
-                margin-top: 10px;
-                font-weight: bold;
-            }
-        """)
+        self.full_path_label.setStyleSheet(_FULL_PATH_QSS)
         self.full_path_label.setWordWrap(True)
         
         layout.addWidget(self.full_path_label)
         
         layout.addStretch()
 
-        # 添加到Tab
-        self.tab_widget.addTab(page, "项目信息")
+    def _ensure_page_built(self, index: int):
+        """确保延迟创建的Tab页面内容已经创建"""
+        builder = self._page_builders.get(index)
+        if builder is not None and index not in self._pages_built:
+            builder(self.tab_widget.widget(index))
+            self._pages_built.add(index)
 
-    def _create_dataset_config_page(self):
+    def _build_dataset_config_page(self, page: QWidget):
         """创建数据集配置页面"""
-        page = QWidget()
         layout = QVBoxLayout(page)
 
         # 标题
         title = QLabel("数据集配置")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title.setStyleSheet(
-            "color: white; font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title)
 
         # 说明文字
@@ -340,19 +509,6 @@ class CreateProjectWizard(QMainWindow):
         # 添加按钮
         add_button = QPushButton("添加数据集")
         add_button.clicked.connect(self._add_dataset)
-        add_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007ACC;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005999;
-            }
-        """)
         layout.addWidget(add_button)
 
         # 数据集表格
@@ -370,21 +526,24 @@ class CreateProjectWizard(QMainWindow):
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
 
-        layout.addWidget(self.dataset_table)
+        # 表格样式
+        self.dataset_table.setStyleSheet("""
+            QTableWidget {
+                background-color: #363636;
+                color: white;
+                gridline-color: #ddd;
+            }
+        """)
 
-        # 添加到Tab
-        self.tab_widget.addTab(page, "数据集配置")
+        layout.addWidget(self.dataset_table)
 
-    def _create_model_config_page(self):
+    def _build_model_config_page(self, page: QWidget):
         """创建模型配置页面"""
-        page = QWidget()
         layout = QVBoxLayout(page)
 
         # 标题
         title = QLabel("模型配置")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title.setStyleSheet(
-            "color: white; font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title)
 
         # 说明文字
@@ -395,21 +554,22 @@ class CreateProjectWizard(QMainWindow):
         
         # 已选择模型数量提示
         self.selected_models_label = QLabel("已选择模型: 0")
-        self.selected_models_label.setStyleSheet(
-            "color: #007ACC; margin-bottom: 10px; font-size: 12px; font-weight: bold;")
+        self.selected_models_label.setStyleSheet(_MODEL_COUNT_QSS)
         layout.addWidget(self.selected_models_label)
 
         # 模型列表将根据选择的任务类型动态更新
         self.model_list_widget = QWidget()
+        self.model_list_widget.setStyleSheet(_MODEL_LIST_QSS)
         self.model_list_layout = QVBoxLayout(self.model_list_widget)
+        self.model_list_layout.addStretch()
 
         scroll_area = QScrollArea()
         scroll_area.setWidget(self.model_list_widget)
         scroll_area.setWidgetResizable(True)
         layout.addWidget(scroll_area)
 
-        # 添加到Tab
-        self.tab_widget.addTab(page, "模型配置")
+        # 同步当前的模型选择数量
+        self._update_selected_models_display()
 
     def _create_bottom_buttons(self):
         """创建底部按钮"""
@@ -418,7 +578,8 @@ class CreateProjectWizard(QMainWindow):
 
         # 左侧：取消按钮
         self.cancel_button = QPushButton("取消")
-        self.cancel_button.clicked.connect(self.close)
+        self.cancel_button.clicked.connect(
+            self.close, Qt.ConnectionType.QueuedConnection)
 
         # 右侧：上一步、下一步/创建按钮
         layout.addWidget(self.cancel_button)
@@ -435,15 +596,9 @@ class CreateProjectWizard(QMainWindow):
         layout.addWidget(self.next_button)
 
     def _setup_styles(self):
-        """设置样式 - 为每个组件单独设置样式"""
-        # 主窗口样式
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
+        """设置样式"""
+        # 主窗口样式（按钮样式通过样式表级联应用到底部按钮）
+        self.setStyleSheet(_WIZARD_QSS)
 
         # Tab控件样式
         self.tab_widget.setStyleSheet("""
@@ -462,167 +617,134 @@ class CreateProjectWizard(QMainWindow):
             }
         """)
 
-        # 按钮样式
-        button_style = """
-            QPushButton {
-                background-color: #007ACC;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005999;
-            }
-            QPushButton:disabled {
-                background-color: #666;
-            }
-        """
-
-        # 应用按钮样式
-        self.cancel_button.setStyleSheet(button_style)
-        self.prev_button.setStyleSheet(button_style)
-        self.next_button.setStyleSheet(button_style)
-
-        # 输入框样式
-        input_style = """
-            background-color: #363636;
-            color: white;
-            border: 2px solid #999;
-            border-radius: 4px;
-            padding: 5px;
-        """
-
-        # 应用输入框样式
-        self.name_edit.setStyleSheet(input_style)
-        self.description_edit.setStyleSheet(input_style)
-        self.path_edit.setStyleSheet(input_style)
-
-        # 表格样式
-        self.dataset_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #363636;
-                color: white;
-                gridline-color: #ddd;
-            }
-        """)
-
+    @Slot()
     def _browse_project_path(self):
         """浏览项目路径"""
         dir_path = QFileDialog.getExistingDirectory(
             self,
             "选择项目保存路径",
-            str(Path.home())
+            self._last_browse_dir,
+            # 不解析符号链接、不读取自定义目录图标，减少网络文件系统上的stat调用
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.DontUseCustomDirectoryIcons
         )
         if dir_path:
+            self._last_browse_dir = dir_path
             self.path_edit.setText(dir_path)
 
+    @Slot()
     def _add_dataset(self):
         """添加数据集"""
         if self.selected_task_type is None:
             QMessageBox.warning(self, "错误", "请先选择项目类型")
             return
 
-        dialog = DatasetConfigDialog(self.selected_task_type, self)
+        # 复用对话框，仅在任务类型改变时重新创建
+        if (self._dataset_dialog is None or
+                self._dataset_dialog.task_type != self.selected_task_type):
+            if self._dataset_dialog is not None:
+                self._dataset_dialog.deleteLater()
+            self._dataset_dialog = DatasetConfigDialog(self.selected_task_type, self)
+        dialog = self._dataset_dialog
+        dialog.reset_fields()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             dataset_info = dialog.get_dataset_info()
-            self.datasets.append(dataset_info)
-            self._update_dataset_table()
-
-    def _update_dataset_table(self):
-        """更新数据集表格"""
-        self.dataset_table.setRowCount(len(self.datasets))
-
-        for row, dataset in enumerate(self.datasets):
-            # 名称
-            self.dataset_table.setItem(row, 0, QTableWidgetItem(dataset.name))
-            # 任务类型
-            self.dataset_table.setItem(
-                row, 1, QTableWidgetItem(dataset.dataset_type.value))
             # 数据类型（文件夹或压缩包）
-            dataset_path = Path(dataset.path)
-            if dataset_path.is_dir():
+            if Path(dataset_info.path).is_dir():
                 data_type = "📁 文件夹"
             else:
                 data_type = "📦 压缩包"
-            self.dataset_table.setItem(row, 2, QTableWidgetItem(data_type))
-            # 路径
-            self.dataset_table.setItem(row, 3, QTableWidgetItem(dataset.path))
-            # 描述
-            self.dataset_table.setItem(
-                row, 4, QTableWidgetItem(dataset.description))
-            # 删除按钮
-            delete_button = QPushButton("删除")
-            delete_button.clicked.connect(
-                lambda checked, r=row: self._remove_dataset(r))
-            delete_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #dc3545;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 5px 10px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #c82333;
-                }
-            """)
-            self.dataset_table.setCellWidget(row, 5, delete_button)
+            self.datasets.append(dataset_info)
+            self._append_dataset_row(dataset_info, data_type)
+
+    def _append_dataset_row(self, dataset: DatasetInfo, data_type: str):
+        """在数据集表格末尾追加一行"""
+        row = self.dataset_table.rowCount()
+        self.dataset_table.insertRow(row)
+
+        # 名称
+        self.dataset_table.setItem(row, 0, QTableWidgetItem(dataset.name))
+        # 任务类型
+        self.dataset_table.setItem(
+            row, 1, QTableWidgetItem(dataset.dataset_type.value))
+        # 数据类型（文件夹或压缩包）
+        self.dataset_table.setItem(row, 2, QTableWidgetItem(data_type))
+        # 路径
+        self.dataset_table.setItem(row, 3, QTableWidgetItem(dataset.path))
+        # 描述
+        self.dataset_table.setItem(
+            row, 4, QTableWidgetItem(dataset.description))
+        # 删除按钮（点击时再查找按钮所在行，删除其他行后依然正确）
+        delete_button = QPushButton("删除")
+        delete_button.setObjectName("deleteBtn")
+        delete_button.clicked.connect(self._on_delete_dataset_clicked)
+        self.dataset_table.setCellWidget(row, 5, delete_button)
+
+    @Slot()
+    def _on_delete_dataset_clicked(self):
+        """删除按钮所在行的数据集"""
+        button = self.sender()
+        # 删除行后单元格控件的几何位置会延迟更新，因此按控件查找行号而不是按坐标
+        for row in range(self.dataset_table.rowCount()):
+            if self.dataset_table.cellWidget(row, 5) is button:
+                self._remove_dataset(row)
+                return
 
+    @Slot(int)
     def _remove_dataset(self, row: int):
         """删除数据集"""
         if 0 <= row < len(self.datasets):
             self.datasets.pop(row)
-            self._update_dataset_table()
+            self.dataset_table.removeRow(row)
 
     def _update_model_list(self):
         """更新模型列表"""
-        # 清空现有内容
-        for i in reversed(range(self.model_list_layout.count())):
-            item = self.model_list_layout.itemAt(i)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None:
-                    widget.setParent(None)
+        # 任务类型未改变时无需更新
+        if self._current_model_task == self.selected_task_type:
+            return
+
+        # 隐藏上一个任务类型的模型控件
+        for widget in self._model_widgets_by_task.get(self._current_model_task, []):
+            widget.setVisible(False)
+        self._current_model_task = self.selected_task_type
 
         if not self.selected_task_type:
             return
 
+        widgets = self._model_widgets_by_task.get(self.selected_task_type)
+        if widgets is None:
+            # 首次进入该任务类型，创建并缓存控件
+            widgets = self._create_model_widgets(self.selected_task_type)
+            self._model_widgets_by_task[self.selected_task_type] = widgets
+        else:
+            # 复用已缓存的控件，并同步选择状态
+            for widget in widgets:
+                if isinstance(widget, QCheckBox):
+                    widget.blockSignals(True)
+                    widget.setChecked(
+                        widget.property("model_info").filename in self._selected_models)
+                    widget.blockSignals(False)
+                widget.setVisible(True)
+
+        # 更新选择计数显示
+        self._update_selected_models_display()
+
+    def _create_model_widgets(self, task_type: TaskType) -> List[QWidget]:
+        """创建指定任务类型的模型选择控件"""
+        widgets: List[QWidget] = []
+
         # 获取适合的模型
-        models = self.model_selector.get_models_for_task(
-            self.selected_task_type)
+        models = self.model_selector.get_models_for_task(task_type)
 
         for model in models:
             # 使用多选框而不是单选框
             checkbox = QCheckBox(f"{model.name} ({model.parameters})")
-            checkbox.setStyleSheet("""
-                QCheckBox {
-                    color: white;
-                    padding: 5px;
-                    font-weight: bold;
-                }
-                QCheckBox::indicator {
-                    width: 18px;
-                    height: 18px;
-                }
-                QCheckBox::indicator:unchecked {
-                    border: 2px solid #ddd;
-                    background-color: #2b2b2b;
-                    border-radius: 4px;
-                }
-                QCheckBox::indicator:checked {
-                    border: 2px solid #007ACC;
-                    background-color: #007ACC;
-                    border-radius: 4px;
-                }
-            """)
             # 使用自定义属性存储模型信息
             checkbox.setProperty("model_info", model)
             
             # 恢复之前的选择状态
-            if model in self.selected_models:
+            if model.filename in self._selected_models:
                 checkbox.setChecked(True)
             
             # 连接选择事件
@@ -630,53 +752,66 @@ class CreateProjectWizard(QMainWindow):
 
             # 添加描述
             desc_label = QLabel(model.description)
-            desc_label.setStyleSheet(
-                "color: #aaa; font-size: 11px; margin-left: 20px; margin-bottom: 10px;")
+            desc_label.setObjectName("modelDesc")
             desc_label.setWordWrap(True)
 
-            self.model_list_layout.addWidget(checkbox)
-            self.model_list_layout.addWidget(desc_label)
+            # 插入到末尾的弹性空间之前
+            stretch_index = self.model_list_layout.count() - 1
+            self.model_list_layout.insertWidget(stretch_index, checkbox)
+            self.model_list_layout.insertWidget(stretch_index + 1, desc_label)
+            widgets.extend((checkbox, desc_label))
 
-        self.model_list_layout.addStretch()
-        
-        # 更新选择计数显示
-        self._update_selected_models_display()
+        return widgets
 
     def _on_model_selection_changed(self, state, model):
         """模型选择改变时的处理"""
-        from PySide6.QtCore import Qt
-        
         if state == Qt.CheckState.Checked.value:
             # 添加模型到选择列表
-            if model not in self.selected_models:
-                self.selected_models.append(model)
+            self._selected_models[model.filename] = model
         else:
             # 从选择列表中移除模型
-            if model in self.selected_models:
-                self.selected_models.remove(model)
+            self._selected_models.pop(model.filename, None)
         
         # 更新已选择模型数量显示
         self._update_selected_models_display()
 
     def _update_selected_models_display(self):
         """更新已选择模型的显示"""
-        count = len(self.selected_models)
-        if hasattr(self, 'selected_models_label'):
-            if count == 0:
-                self.selected_models_label.setText("已选择模型: 0")
-                self.selected_models_label.setStyleSheet(
-                    "color: #aaa; margin-bottom: 10px; font-size: 12px; font-weight: bold;")
-            else:
-                self.selected_models_label.setText(f"已选择模型: {count}")
-                self.selected_models_label.setStyleSheet(
-                    "color: #007ACC; margin-bottom: 10px; font-size: 12px; font-weight: bold;")
-
+        if self.selected_models_label is None:
+            return
+        count = len(self._selected_models)
+        self.selected_models_label.setText(f"已选择模型: {count}")
+        self._set_label_state(self.selected_models_label, count > 0)
+
+    @property
+    def selected_models(self) -> List[ModelInfo]:
+        """已选择的模型列表（按选择顺序）"""
+        return list(self._selected_models.values())
+
+    @property
+    def project_name(self) -> str:
+        """项目名称（项目信息页面尚未创建时为空）"""
+        if not hasattr(self, 'name_edit'):
+            return ""
+        return self.name_edit.text().strip()
+
+    @property
+    def project_description(self) -> str:
+        """项目描述"""
+        if not hasattr(self, 'description_edit'):
+            return ""
+        return self.description_edit.toPlainText().strip()
+
+    @property
+    def project_path(self) -> str:
+        """项目保存路径"""
+        if not hasattr(self, 'path_edit'):
+            return ""
+        return self.path_edit.text().strip()
+
+    @Slot()
     def _on_project_info_changed(self):
         """项目信息改变时的处理"""
-        self.project_name = self.name_edit.text().strip()
-        self.project_description = self.description_edit.toPlainText().strip()
-        self.project_path = self.path_edit.text().strip()
-        
         # 更新完整路径显示
         self._update_full_path_display()
         
@@ -684,64 +819,57 @@ class CreateProjectWizard(QMainWindow):
     
     def _update_full_path_display(self):
         """更新完整路径显示"""
-        if self.project_name and self.project_path:
+        project_name = self.project_name
+        project_path = self.project_path
+        if project_name and project_path:
             # 构建完整路径
-            full_path = Path(self.project_path) / self.project_name
+            full_path = os.path.join(project_path, project_name)
             self.full_path_label.setText(f"项目将保存到: {full_path}")
-            self.full_path_label.setStyleSheet("""
-                QLabel {
-                    color: #007ACC;
-                    background-color: #363636;
-                    border: 1px solid #007ACC;
-                    border-radius: 4px;
-                    padding: 8px;
-                    margin-top: 10px;
-                    font-weight: bold;
-                }
-            """)
+            self._set_label_state(self.full_path_label, True)
         else:
             # 都没填写
             self.full_path_label.setText("请填写项目名称和路径")
-            self.full_path_label.setStyleSheet("""
-                QLabel {
-                    color: #aaa;
-                    background-color: #363636;
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    padding: 8px;
-                    margin-top: 10px;
-                    font-weight: bold;
-                }
-            """)
+            self._set_label_state(self.full_path_label, False)
+
+    @staticmethod
+    def _set_label_state(label: QLabel, ok: bool):
+        """切换标签的state动态属性，只重新应用已解析的样式"""
+        state = "ok" if ok else ""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
+    @Slot(int)
     def _on_tab_changed(self, index):
         """Tab页面切换时的处理"""
-        # 如果切换到模型配置页面且需要更新模型列表
+        # 首次进入时创建页面内容
+        self._ensure_page_built(index)
+
+        # 如果切换到模型配置页面则同步模型列表（任务类型未变时直接返回）
         if index == 3 and self.selected_task_type:  # 模型配置页面索引为3
-            # 只有在任务类型改变或首次进入时才更新模型列表
-            if (not self._model_list_initialized or 
-                self._last_task_type != self.selected_task_type):
-                self._update_model_list()
-                self._model_list_initialized = True
-                self._last_task_type = self.selected_task_type
+            self._update_model_list()
         # 更新按钮状态
         self._update_button_state()
 
     def _update_button_state(self):
         """更新按钮状态"""
         current_index = self.tab_widget.currentIndex()
-        total_tabs = self.tab_widget.count()
+        is_last = current_index == self._total_tabs - 1
+        can_next = self._can_create_project() if is_last else self._can_proceed_to_next()
+
+        state = (current_index, can_next)
+        if state == self._last_button_state:
+            return
+        self._last_button_state = state
 
         # 上一步按钮
         self.prev_button.setEnabled(current_index > 0)
 
         # 下一步/创建按钮
-        if current_index == total_tabs - 1:
-            self.next_button.setText("创建项目")
-            self.next_button.setEnabled(self._can_create_project())
-        else:
-            self.next_button.setText("下一步")
-            self.next_button.setEnabled(self._can_proceed_to_next())
+        self.next_button.setText("创建项目" if is_last else "下一步")
+        self.next_button.setEnabled(can_next)
 
     def _can_proceed_to_next(self) -> bool:
         """判断是否可以进行下一步"""
@@ -761,6 +889,7 @@ class CreateProjectWizard(QMainWindow):
         return (self.selected_task_type is not None and
                 bool(self.project_name and self.project_path))
 
+    @Slot()
     def _prev_step(self):
         """上一步"""
         current_index = self.tab_widget.currentIndex()
@@ -768,12 +897,12 @@ class CreateProjectWizard(QMainWindow):
             self.tab_widget.setCurrentIndex(current_index - 1)
             # Tab切换会自动触发_on_tab_changed，无需再次调用_update_button_state
 
+    @Slot()
     def _next_step(self):
         """下一步或创建项目"""
         current_index = self.tab_widget.currentIndex()
-        total_tabs = self.tab_widget.count()
 
-        if current_index == total_tabs - 1:
+        if current_index == self._total_tabs - 1:
             # 最后一步，创建项目
             self._create_project()
         else:
@@ -785,6 +914,7 @@ class CreateProjectWizard(QMainWindow):
             self.tab_widget.setCurrentIndex(current_index + 1)
             # Tab切换会自动触发_on_tab_changed，无需再次调用_update_button_state
 
+    @Slot()
     def _create_project(self):
         """创建项目"""
         # 验证必要信息
@@ -792,28 +922,62 @@ class CreateProjectWizard(QMainWindow):
             QMessageBox.warning(self, "错误", "请选择项目类型")
             return
 
+        # 构建项目路径
+        project_name = self.project_name
+        full_project_path = Path(self.project_path) / project_name
+
+        # 目录创建和数据集导入在后台线程中进行，期间锁定按钮
+        self._set_creating(True)
+        self._create_worker = CreateProjectWorker(
+            full_project_path, project_name, self.selected_task_type,
+            self.project_description, self.datasets, self)
+        self._create_worker.succeeded.connect(self._on_project_files_created)
+        self._create_worker.failed.connect(self._on_create_project_failed)
+        self._create_worker.finished.connect(self._create_worker.deleteLater)
+        self._create_worker.start()
+
+    @Slot(object)
+    def _on_project_files_created(self, project: Project):
+        """项目目录和数据集准备完成后，在GUI线程中添加预训练模型"""
+        self._create_worker = None
         try:
-            from ..model.project import Project
-
-            # 构建项目路径
-            full_project_path = Path(self.project_path) / self.project_name
-
-            # 创建项目
-            project = Project.create_new(
-                project_path=str(full_project_path),  # 转换为字符串
-                project_name=self.project_name,  # 使用正确的参数名
-                task_type=self.selected_task_type,
-                description=self.project_description
-            )
-            
-            initialize_project(project, self.datasets, self.selected_models)
+            # 预训练模型可能需要弹出下载对话框，必须在GUI线程中处理
+            add_pretrained_models(project, self.datasets, self.selected_models)
             # 保存配置
             project.save_config()
+        except Exception as e:
+            self._on_create_project_failed(str(e))
+            return
 
-            # 发送信号
-            self.project_created.emit(str(full_project_path))
+        # 发送信号
+        self.project_created.emit(str(project.project_path))
+
+        # 关闭窗口
+        self.close()
+
+    @Slot(str)
+    def _on_create_project_failed(self, message: str):
+        """创建项目失败时的处理"""
+        self._create_worker = None
+        self._set_creating(False)
+        QMessageBox.critical(self, "创建项目失败", f"创建项目时发生错误：{message}")
+
+    def _set_creating(self, creating: bool):
+        """切换创建中状态"""
+        self.tab_widget.setEnabled(not creating)
+        self.cancel_button.setEnabled(not creating)
+        if creating:
+            self.prev_button.setEnabled(False)
+            self.next_button.setEnabled(False)
+            self.next_button.setText("正在创建...")
+        else:
+            # 按钮已被临时修改，强制重新应用状态
+            self._last_button_state = None
+            self._update_button_state()
 
-            # 关闭窗口
-            self.close()
-        except Exception as e:
-            QMessageBox.critical(self, "创建项目失败", f"创建项目时发生错误：{str(e)}")
+    def closeEvent(self, event):
+        """创建项目期间不允许关闭窗口"""
+        if self._create_worker is not None:
+            event.ignore()
+            return
+        super().closeEvent(event)
@@ -2,20 +2,153 @@
 Dataset configuration dialog
 
 """
+import os
+import stat
+from functools import partial
 from pathlib import Path
+from typing import Optional, Set
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit,
-    QTextEdit, QFileDialog, QDialog, QFormLayout, QComboBox,
-    QRadioButton, QMessageBox, QMainWindow
+    QPlainTextEdit, QFileDialog, QDialog, QFormLayout, QComboBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QThread
 
 from ..model.enums import TaskType, DatasetType
 from ..model.project import DatasetInfo
 from .components import CustomTitleBar
 from .components.message_box import show_warning_message
-from ..__version__ import __version__
+
+
+# 用户主目录，作为文件对话框的默认起始目录
+_HOME_DIR = str(Path.home())
+
+# 对话框样式：在对话框上设置一次，子控件通过类型和objectName匹配
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+    }
+    QLabel#formLabel {
+        color: white;
+        font-weight: bold;
+    }
+    QLabel#infoLabel {
+        color: #ffd700;
+        font-size: 12px;
+        font-weight: bold;
+        background-color: #4a4a00;
+        border: 1px solid #ffd700;
+        border-radius: 4px;
+        padding: 8px;
+        margin-bottom: 10px;
+    }
+    QLineEdit, QPlainTextEdit, QComboBox {
+        background-color: #363636;
+        color: white;
+        border: 2px solid #999;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 12px;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        color: white;
+    }
+    QPushButton#browseFolderBtn, QPushButton#browseFileBtn,
+    QPushButton#cancelBtn, QPushButton#okBtn {
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#browseFolderBtn, QPushButton#browseFileBtn {
+        padding: 8px 12px;
+        font-size: 11px;
+    }
+    QPushButton#cancelBtn, QPushButton#okBtn {
+        padding: 10px 20px;
+    }
+    QPushButton#browseFolderBtn, QPushButton#okBtn {
+        background-color: #007ACC;
+    }
+    QPushButton#browseFolderBtn:hover, QPushButton#okBtn:hover {
+        background-color: #005999;
+    }
+    QPushButton#browseFileBtn {
+        background-color: #28a745;
+    }
+    QPushButton#browseFileBtn:hover {
+        background-color: #218838;
+    }
+    QPushButton#cancelBtn {
+        background-color: #666;
+    }
+    QPushButton#cancelBtn:hover {
+        background-color: #555;
+    }
+"""
+
+# 支持的数据集压缩包格式
+_SUPPORTED_ARCHIVE_EXTS: frozenset[str] = frozenset(
+    ('.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'))
+
+# 选择压缩包时的文件过滤器
+_ARCHIVE_FILE_FILTER = "压缩包文件 (*.zip *.rar *.7z *.tar *.gz *.bz2);;所有文件 (*.*)"
+
+
+def _check_dataset_path(path_text: str) -> str:
+    """检查数据集路径，返回错误信息（为空表示通过）"""
+    # 验证路径是否存在（只做一次stat，后续根据结果判断类型）
+    try:
+        st = os.stat(path_text)
+    except OSError:
+        return "所选择的数据集路径不存在"
+
+    # 检查是文件夹还是文件
+    if stat.S_ISDIR(st.st_mode):
+        # 是文件夹，检查是否为空（读到第一个条目即可判断）
+        try:
+            with os.scandir(path_text) as it:
+                empty = next(it, None) is None
+        except OSError:
+            return "无法读取所选择的数据集文件夹"
+        if empty:
+            return "所选择的数据集文件夹为空"
+    elif stat.S_ISREG(st.st_mode):
+        # 是文件，检查是否为支持的压缩包格式
+        if os.path.splitext(path_text)[1].lower() not in _SUPPORTED_ARCHIVE_EXTS:
+            return "请选择支持的压缩包格式（.zip, .rar, .7z, .tar, .gz, .bz2）"
+    else:
+        return "请选择一个有效的文件夹或压缩包文件"
+    return ""
+
+
+class PathValidationWorker(QThread):
+    """在后台线程中检查数据集路径，避免慢速磁盘阻塞界面"""
+
+    validated = Signal(str)  # 验证完成信号，参数为错误信息（为空表示通过）
+
+    def __init__(self, path_text: str):
+        super().__init__()
+        self.path_text = path_text
+
+    def run(self):
+        """执行路径检查"""
+        self.validated.emit(_check_dataset_path(self.path_text))
+
+
+# 正在运行的验证线程，保证对话框提前销毁时线程对象仍然存活到结束
+_active_validators: Set[PathValidationWorker] = set()
+
+
+def _release_validator(worker: PathValidationWorker):
+    """验证线程结束后释放引用"""
+    worker.wait()
+    _active_validators.discard(worker)
 
 
 class DatasetConfigDialog(QDialog):
@@ -24,6 +157,10 @@ class DatasetConfigDialog(QDialog):
     def __init__(self, task_type: TaskType, parent=None):
         super().__init__(parent)
         self.task_type = task_type
+        # 上次浏览选择的目录
+        self._last_browse_dir: str = _HOME_DIR
+        # 当前正在进行的路径验证（没有时为None）
+        self._validation_worker: Optional[PathValidationWorker] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -40,7 +177,8 @@ class DatasetConfigDialog(QDialog):
 
         # 自定义标题栏
         self.title_bar = CustomTitleBar(self, "添加数据集")
-        self.title_bar.close_clicked.connect(self.reject)
+        self.title_bar.close_clicked.connect(
+            self.reject, Qt.ConnectionType.QueuedConnection)
         main_layout.addWidget(self.title_bar)
 
         # 内容区域
@@ -55,57 +193,22 @@ class DatasetConfigDialog(QDialog):
         # 数据集名称
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("输入数据集名称")
-        self.name_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #363636;
-                color: white;
-                border: 2px solid #999;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-            }
-        """)
 
         name_label = QLabel("名称*:")
-        name_label.setStyleSheet("color: white; font-weight: bold;")
+        name_label.setObjectName("formLabel")
         form_layout.addRow(name_label, self.name_edit)
 
         # 数据集类型
         self.type_combo = QComboBox()
         self.type_combo.addItems([self.task_type.value])  # 默认使用项目类型
-        self.type_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #363636;
-                color: white;
-                border: 2px solid #999;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                color: white;
-            }
-        """)
 
         type_label = QLabel("类型:")
-        type_label.setStyleSheet("color: white; font-weight: bold;")
+        type_label.setObjectName("formLabel")
         form_layout.addRow(type_label, self.type_combo)
 
         # 数据集说明
         info_label = QLabel("📁 请选择已标注好的数据集（支持文件夹或压缩包格式）")
-        info_label.setStyleSheet("""
-            color: #ffd700; 
-            font-size: 12px; 
-            font-weight: bold; 
-            background-color: #4a4a00; 
-            border: 1px solid #ffd700; 
-            border-radius: 4px; 
-            padding: 8px; 
-            margin-bottom: 10px;
-        """)
+        info_label.setObjectName("infoLabel")
         info_label.setWordWrap(True)
         content_layout.addWidget(info_label)
 
@@ -114,76 +217,30 @@ class DatasetConfigDialog(QDialog):
         self.path_edit = QLineEdit()
         self.path_edit.setPlaceholderText(
             "选择数据集文件夹或压缩包（支持 .zip, .rar, .7z 等格式）")
-        self.path_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #363636;
-                color: white;
-                border: 2px solid #999;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-            }
-        """)
 
         browse_folder_button = QPushButton("选择文件夹")
         browse_folder_button.clicked.connect(self._browse_dataset_folder)
-        browse_folder_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007ACC;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #005999;
-            }
-        """)
+        browse_folder_button.setObjectName("browseFolderBtn")
 
         browse_file_button = QPushButton("选择压缩包")
         browse_file_button.clicked.connect(self._browse_dataset_file)
-        browse_file_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        browse_file_button.setObjectName("browseFileBtn")
 
         path_layout.addWidget(self.path_edit)
         path_layout.addWidget(browse_folder_button)
         path_layout.addWidget(browse_file_button)
 
         path_label = QLabel("数据集路径*:")
-        path_label.setStyleSheet("color: white; font-weight: bold;")
+        path_label.setObjectName("formLabel")
         form_layout.addRow(path_label, path_layout)
 
         # 描述
-        self.description_edit = QTextEdit()
+        self.description_edit = QPlainTextEdit()
         self.description_edit.setPlaceholderText("输入数据集描述（可选）")
         self.description_edit.setFixedHeight(100)
-        self.description_edit.setStyleSheet("""
-            QTextEdit {
-                background-color: #363636;
-                color: white;
-                border: 2px solid #999;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-            }
-        """)
 
         desc_label = QLabel("描述:")
-        desc_label.setStyleSheet("color: white; font-weight: bold;")
+        desc_label.setObjectName("formLabel")
         form_layout.addRow(desc_label, self.description_edit)
 
         content_layout.addLayout(form_layout)
@@ -192,106 +249,102 @@ class DatasetConfigDialog(QDialog):
         button_layout = QHBoxLayout()
 
         cancel_button = QPushButton("取消")
-        cancel_button.clicked.connect(self.reject)
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #666;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #555;
-            }
-        """)
-
-        ok_button = QPushButton("确定")
-        ok_button.clicked.connect(self._validate_and_accept)
-        ok_button.setStyleSheet("""
-            QPushButton {
-                background-color: #007ACC;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005999;
-            }
-        """)
+        cancel_button.clicked.connect(
+            self.reject, Qt.ConnectionType.QueuedConnection)
+        cancel_button.setObjectName("cancelBtn")
+
+        self.ok_button = QPushButton("确定")
+        self.ok_button.clicked.connect(self._validate_and_accept)
+        self.ok_button.setObjectName("okBtn")
 
         button_layout.addStretch()
         button_layout.addWidget(cancel_button)
-        button_layout.addWidget(ok_button)
+        button_layout.addWidget(self.ok_button)
 
         content_layout.addLayout(button_layout)
         main_layout.addWidget(content_widget)
 
-        # 对话框整体样式
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
+        # 对话框样式（所有子控件的样式统一在此设置）
+        self.setStyleSheet(_DIALOG_QSS)
+
+    def reset_fields(self):
+        """清空已填写的内容，以便复用对话框"""
+        self.name_edit.clear()
+        self.path_edit.clear()
+        self.description_edit.clear()
+        self._cancel_validation()
+
+    def reject(self):
+        """取消对话框，放弃尚未完成的路径验证"""
+        self._cancel_validation()
+        super().reject()
+
+    def _cancel_validation(self):
+        """放弃当前的路径验证，其结果返回后将被忽略"""
+        self._validation_worker = None
+        self.ok_button.setEnabled(True)
 
+    @Slot()
     def _browse_dataset_folder(self):
         """浏览数据集文件夹"""
         dir_path = QFileDialog.getExistingDirectory(
             self,
             "选择已标注的数据集文件夹",
-            str(Path.home())
+            self._last_browse_dir,
+            # 不解析符号链接、不读取自定义目录图标，减少网络文件系统上的stat调用
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.DontUseCustomDirectoryIcons
         )
         if dir_path:
+            self._last_browse_dir = dir_path
             self.path_edit.setText(dir_path)
 
+    @Slot()
     def _browse_dataset_file(self):
         """浏览数据集压缩包"""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "选择已标注的数据集压缩包",
-            str(Path.home()),
-            "压缩包文件 (*.zip *.rar *.7z *.tar *.gz *.bz2);;所有文件 (*.*)"
+            self._last_browse_dir,
+            _ARCHIVE_FILE_FILTER
         )
         if file_path:
+            self._last_browse_dir = str(Path(file_path).parent)
             self.path_edit.setText(file_path)
 
+    @Slot()
     def _validate_and_accept(self):
         """验证并接受"""
         if not self.name_edit.text().strip():
             show_warning_message(self, "验证错误", "请输入数据集名称")
             return
 
-        if not self.path_edit.text().strip():
+        path_text = self.path_edit.text().strip()
+        if not path_text:
             show_warning_message(self, "验证错误", "请选择数据集路径（文件夹或压缩包）")
             return
 
-        # 验证路径是否存在
-        dataset_path = Path(self.path_edit.text().strip())
-        if not dataset_path.exists():
-            show_warning_message(self, "验证错误", "所选择的数据集路径不存在")
+        # 磁盘检查在后台线程中进行，期间禁用确定按钮
+        self.ok_button.setEnabled(False)
+        worker = PathValidationWorker(path_text)
+        worker.validated.connect(self._on_path_validated)
+        worker.finished.connect(partial(_release_validator, worker))
+        _active_validators.add(worker)
+        self._validation_worker = worker
+        worker.start()
+
+    @Slot(str)
+    def _on_path_validated(self, error: str):
+        """路径验证完成"""
+        # 忽略已被取消或被新的验证取代的结果
+        if self.sender() is not self._validation_worker:
             return
+        self._validation_worker = None
+        self.ok_button.setEnabled(True)
 
-        # 检查是文件夹还是文件
-        if dataset_path.is_dir():
-            # 是文件夹，检查是否为空
-            if not any(dataset_path.iterdir()):
-                show_warning_message(self, "验证错误", "所选择的数据集文件夹为空")
-                return
-        elif dataset_path.is_file():
-            # 是文件，检查是否为支持的压缩包格式
-            supported_extensions = {
-                '.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'}
-            if dataset_path.suffix.lower() not in supported_extensions:
-                show_warning_message(
-                    self, "验证错误", "请选择支持的压缩包格式（.zip, .rar, .7z, .tar, .gz, .bz2）")
-                return
-        else:
-            show_warning_message(self, "验证错误", "请选择一个有效的文件夹或压缩包文件")
+        if error:
+            show_warning_message(self, "验证错误", error)
             return
 
         self.accept()
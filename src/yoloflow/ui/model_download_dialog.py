@@ -2,24 +2,99 @@
 模型下载进度对话框
 """
 
+import time
 from typing import Callable, Optional
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QProgressBar, QPushButton, QFrame, QDialog
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QProgressBar, QPushButton, QDialog
 )
 from PySide6.QtCore import Qt, Signal, QThread
-from PySide6.QtGui import QFont
 
 from .components import CustomTitleBar
 
 
+# 每次从网络读取的块大小
+_CHUNK_SIZE = 256 * 1024
+
+# 进度信号的最小发送间隔（秒），界面每秒最多刷新20次
+_EMIT_INTERVAL = 0.05
+
+# 所有下载共用的HTTP会话（首次下载时创建），复用连接和TLS会话
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """获取共用的HTTP会话"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+# 对话框样式：在对话框上设置一次，子控件通过类型和objectName匹配
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #34495e;
+        border-radius: 8px;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+    }
+    QWidget#downloadContent {
+        background-color: #34495e;
+        border-radius: 0px 0px 8px 8px;
+    }
+    QLabel#downloadStatus {
+        color: #ecf0f1;
+        font-size: 14px;
+        background: transparent;
+    }
+    QProgressBar {
+        border: 2px solid #2c3e50;
+        border-radius: 8px;
+        text-align: center;
+        background-color: #2c3e50;
+        color: #ecf0f1;
+        font-size: 12px;
+        height: 20px;
+    }
+    QProgressBar::chunk {
+        background-color: #3498db;
+        border-radius: 6px;
+    }
+    QPushButton#downloadCancelBtn {
+        background-color: #e74c3c;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QPushButton#downloadCancelBtn:hover {
+        background-color: #c0392b;
+    }
+    QPushButton#downloadCancelBtn:pressed {
+        background-color: #a93226;
+    }
+    QPushButton#downloadCancelBtn:disabled {
+        background-color: #7f8c8d;
+        color: #bdc3c7;
+    }
+"""
+
+
 class DownloadWorker(QThread):
     """下载工作线程"""
     
     progress_updated = Signal(int)  # 进度更新信号
     status_updated = Signal(str)    # 状态更新信号
+    size_unknown = Signal()         # 服务器未返回文件大小信号
     download_finished = Signal(bool, str)  # 下载完成信号 (success, message)
     
     def __init__(self, download_url: str, output_path: Path, filename: str):
@@ -36,35 +111,52 @@ class DownloadWorker(QThread):
     def run(self):
         """执行下载"""
         try:
-            import requests
-            from urllib.parse import urlparse
-            
             # 确保输出目录存在
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # 先下载到临时文件，完成后再重命名，取消时保留已下载的部分以便续传
+            part_path = self.output_path.with_name(self.output_path.name + ".part")
+            resume_from = part_path.stat().st_size if part_path.exists() else 0
             
             self.status_updated.emit("正在连接服务器...")
             
-            # 发送HEAD请求获取文件大小
-            response = requests.head(self.download_url, allow_redirects=True)
-            if response.status_code != 200:
+            # 直接发送GET请求，文件大小从响应头中读取
+            session = _get_session()
+            headers = {'Range': f'bytes={resume_from}-'} if resume_from else {}
+            response = session.get(self.download_url, stream=True, allow_redirects=True,
+                                   timeout=(5, 30), headers=headers)
+            if response.status_code == 416:
+                # 已下载的部分无效，重新完整下载
+                response.close()
+                resume_from = 0
+                response = session.get(self.download_url, stream=True, allow_redirects=True,
+                                       timeout=(5, 30))
+
+            if response.status_code == 206:
+                # 服务器支持续传，从已下载的位置继续
+                mode = 'ab'
+            elif response.status_code == 200:
+                # 服务器返回完整文件，重新下载
+                mode = 'wb'
+                resume_from = 0
+            else:
                 self.download_finished.emit(False, f"无法访问下载链接: {response.status_code}")
                 return
             
-            total_size = int(response.headers.get('content-length', 0))
+            content_length = int(response.headers.get('content-length', 0))
+            total_size = resume_from + content_length if content_length else 0
             
+            if total_size == 0:
+                # 无法得知文件大小，只显示已下载的字节数
+                self.size_unknown.emit()
             self.status_updated.emit(f"开始下载 {self.filename}...")
             
-            # 开始下载
-            response = requests.get(self.download_url, stream=True, allow_redirects=True)
-            if response.status_code != 200:
-                self.download_finished.emit(False, f"下载失败: {response.status_code}")
-                return
-            
-            downloaded_size = 0
-            chunk_size = 8192
+            downloaded_size = resume_from
+            last_emit = 0.0
+            last_progress = -1
             
-            with open(self.output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
                     if self._cancelled:
                         self.download_finished.emit(False, "下载已取消")
                         return
@@ -73,19 +165,33 @@ class DownloadWorker(QThread):
                         f.write(chunk)
                         downloaded_size += len(chunk)
                         
-                        # 更新进度
-                        if total_size > 0:
+                        # 限制更新频率，每块都写入磁盘但不必每块都通知界面
+                        now = time.monotonic()
+                        if total_size == 0:
+                            if now - last_emit >= _EMIT_INTERVAL:
+                                last_emit = now
+                                mb_downloaded = downloaded_size / (1024 * 1024)
+                                self.status_updated.emit(
+                                    f"正在下载 {self.filename}... {mb_downloaded:.1f}MB"
+                                )
+                        elif now - last_emit >= _EMIT_INTERVAL or downloaded_size >= total_size:
+                            last_emit = now
+
+                            # 更新进度（百分比变化时才发送）
                             progress = int((downloaded_size / total_size) * 100)
-                            self.progress_updated.emit(progress)
-                        
-                        # 更新状态
-                        if total_size > 0:
+                            if progress != last_progress:
+                                last_progress = progress
+                                self.progress_updated.emit(progress)
+
+                            # 更新状态
                             mb_downloaded = downloaded_size / (1024 * 1024)
                             mb_total = total_size / (1024 * 1024)
                             self.status_updated.emit(
                                 f"正在下载 {self.filename}... {mb_downloaded:.1f}MB / {mb_total:.1f}MB"
                             )
             
+            part_path.replace(self.output_path)
+
             self.status_updated.emit("下载完成")
             self.progress_updated.emit(100)
             self.download_finished.emit(True, "下载成功")
@@ -122,14 +228,8 @@ class ModelDownloadDialog(QDialog):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
-        # 设置对话框样式
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #34495e;
-                border-radius: 8px;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
+        # 对话框样式（所有子控件的样式统一在此设置）
+        self.setStyleSheet(_DIALOG_QSS)
         
         # 自定义标题栏
         self.title_bar = CustomTitleBar(self, title)
@@ -137,46 +237,20 @@ class ModelDownloadDialog(QDialog):
         
         # 内容区域
         content_widget = QWidget()
-        content_widget.setStyleSheet("""
-            QWidget {
-                background-color: #34495e;
-                border-radius: 0px 0px 8px 8px;
-            }
-        """)
+        content_widget.setObjectName("downloadContent")
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(30, 20, 30, 30)
         content_layout.setSpacing(20)
         
         # 状态标签
         self.status_label = QLabel("准备下载...")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #ecf0f1;
-                font-size: 14px;
-                background: transparent;
-            }
-        """)
+        self.status_label.setObjectName("downloadStatus")
         content_layout.addWidget(self.status_label)
         
         # 进度条
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2c3e50;
-                border-radius: 8px;
-                text-align: center;
-                background-color: #2c3e50;
-                color: #ecf0f1;
-                font-size: 12px;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 6px;
-            }
-        """)
         content_layout.addWidget(self.progress_bar)
         
         # 按钮区域
@@ -185,26 +259,7 @@ class ModelDownloadDialog(QDialog):
         
         self.cancel_button = QPushButton("取消")
         self.cancel_button.setFixedSize(80, 32)
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-            QPushButton:disabled {
-                background-color: #7f8c8d;
-                color: #bdc3c7;
-            }
-        """)
+        self.cancel_button.setObjectName("downloadCancelBtn")
         self.cancel_button.setCursor(Qt.CursorShape.PointingHandCursor)
         button_layout.addWidget(self.cancel_button)
         
@@ -223,6 +278,7 @@ class ModelDownloadDialog(QDialog):
         
         self.is_downloading = True
         self.cancel_button.setEnabled(True)
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.status_label.setText(f"准备下载 {filename}...")
         
@@ -230,13 +286,27 @@ class ModelDownloadDialog(QDialog):
         self.download_worker = DownloadWorker(download_url, output_path, filename)
         self.download_worker.progress_updated.connect(self.progress_bar.setValue)
         self.download_worker.status_updated.connect(self.status_label.setText)
+        self.download_worker.size_unknown.connect(self._on_size_unknown)
         self.download_worker.download_finished.connect(self._on_download_finished)
+        self.download_worker.finished.connect(self.download_worker.deleteLater)
         
         self.download_worker.start()
     
+    def _on_size_unknown(self):
+        """文件大小未知时，进度条切换为不确定模式"""
+        self.progress_bar.setRange(0, 0)
+
     def _on_download_finished(self, success: bool, message: str):
         """下载完成处理"""
         self.is_downloading = False
+
+        # 释放下载线程：完成信号发出后run随即返回，等待线程结束即可
+        if self.download_worker is not None:
+            self.download_worker.wait()
+            self.download_worker = None
+
+        # 恢复进度条（可能处于不确定模式）
+        self.progress_bar.setRange(0, 100)
         self.cancel_button.setEnabled(False)
         
         if success:
@@ -267,7 +337,7 @@ class ModelDownloadDialog(QDialog):
     
     def closeEvent(self, event):
         """窗口关闭事件"""
-        if self.download_worker and self.is_downloading:
+        if self.download_worker is not None and self.is_downloading:
             self.download_worker.cancel()
             self.download_worker.wait(3000)  # 等待最多3秒
         event.accept()
@@ -1,15 +1,23 @@
 """
 工作区页面模块
+
+页面模块在首次访问对应的类时才导入（PEP 562），
+仅导入本包不会加载任何页面。
 """
 
-from .home_page import HomePage
-from .dataset_page import DatasetPage
-from .model_page import ModelPage
-from .job_page import JobPage
-from .training_page import TrainingPage
-from .log_page import LogPage
-from .evaluation_page import EvaluationPage
-from .export_page import ExportPage
+import importlib
+
+# 页面类名 -> 所在模块
+_LAZY_PAGES = {
+    'HomePage': 'home_page',
+    'DatasetPage': 'dataset_page',
+    'ModelPage': 'model_page',
+    'JobPage': 'job_page',
+    'TrainingPage': 'training_page',
+    'LogPage': 'log_page',
+    'EvaluationPage': 'evaluation_page',
+    'ExportPage': 'export_page',
+}
 
 __all__ = [
     'HomePage',
@@ -21,3 +29,17 @@ __all__ = [
     'EvaluationPage',
     'ExportPage'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_PAGES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # 缓存到模块命名空间，之后的访问不再经过__getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,6 +12,39 @@ from PySide6.QtCore import Qt, Signal, QSize, QTimer
 from PySide6.QtGui import QPixmap, QIcon, QFont, QAction
 
 
+# 数据集卡片样式，设置在列表页面上由所有卡片共享
+_CARD_QSS = """
+    DatasetCard {
+        background-color: #3a3a3a;
+        border: 1px solid #555555;
+        border-radius: 8px;
+    }
+    DatasetCard:hover {
+        background-color: #404040;
+        border-color: #666666;
+    }
+    QLabel#cardImage {
+        background-color: #2a2a2a;
+        border: 1px dashed #666666;
+        border-radius: 4px;
+        color: #888888;
+    }
+    QLabel#cardName {
+        color: #ffffff;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QLabel#cardType {
+        color: #cccccc;
+        font-size: 12px;
+    }
+    QLabel#cardDesc {
+        color: #aaaaaa;
+        font-size: 11px;
+    }
+"""
+
+
 class ResponsiveGridWidget(QWidget):
     """响应式网格容器"""
     
@@ -207,17 +240,6 @@ class DatasetCard(QFrame):
         """设置卡片UI"""
         self.setFixedHeight(220)  # 只固定高度，宽度由容器控制
         self.setFrameStyle(QFrame.Shape.Box)
-        self.setStyleSheet("""
-            DatasetCard {
-                background-color: #3a3a3a;
-                border: 1px solid #555555;
-                border-radius: 8px;
-            }
-            DatasetCard:hover {
-                background-color: #404040;
-                border-color: #666666;
-            }
-        """)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -227,14 +249,7 @@ class DatasetCard(QFrame):
         image_label = QLabel()
         image_label.setFixedHeight(120)
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setStyleSheet("""
-            QLabel {
-                background-color: #2a2a2a;
-                border: 1px dashed #666666;
-                border-radius: 4px;
-                color: #888888;
-            }
-        """)
+        image_label.setObjectName("cardImage")
         image_label.setText("预览图片")
         layout.addWidget(image_label)
         
@@ -244,34 +259,18 @@ class DatasetCard(QFrame):
         
         # 数据集名称
         name_label = QLabel(self.dataset_name)
-        name_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 14px;
-            }
-        """)
+        name_label.setObjectName("cardName")
         info_layout.addWidget(name_label)
         
         # 数据集类型
         type_label = QLabel(f"类型: {self.dataset_type}")
-        type_label.setStyleSheet("""
-            QLabel {
-                color: #cccccc;
-                font-size: 12px;
-            }
-        """)
+        type_label.setObjectName("cardType")
         info_layout.addWidget(type_label)
         
         # 描述
         desc_label = QLabel(self.description)
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("""
-            QLabel {
-                color: #aaaaaa;
-                font-size: 11px;
-            }
-        """)
+        desc_label.setObjectName("cardDesc")
         info_layout.addWidget(desc_label)
         
         layout.addLayout(info_layout)
@@ -472,6 +471,7 @@ class DatasetPage(QWidget):
     def _create_dataset_list_page(self):
         """创建数据集列表页面"""
         page = QWidget()
+        page.setStyleSheet(_CARD_QSS)
         layout = QVBoxLayout(page)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
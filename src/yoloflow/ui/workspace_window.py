@@ -14,8 +14,8 @@ from ..service import ProjectManager
 from .components.workspace_title_bar import WorkspaceTitleBar
 from .components.workflow_bar import WorkflowBar
 from .components.status_bar import StatusBar
-from .pages import (HomePage, DatasetPage, ModelPage, JobPage,
-                    TrainingPage, LogPage, EvaluationPage, ExportPage)
+# 页面模块在创建工作区窗口时才加载
+from . import pages
 
 # Windows API 常量，用于 nativeEvent
 # https://learn.microsoft.com/en-us/windows/win32/inputdev/wm-nchittest
@@ -135,8 +135,8 @@ class WorkspaceWindow(QMainWindow):
     def _create_pages(self):
         """创建所有页面"""
         page_classes = [
-            HomePage, DatasetPage, ModelPage, JobPage,
-            TrainingPage, LogPage, EvaluationPage, ExportPage
+            pages.HomePage, pages.DatasetPage, pages.ModelPage, pages.JobPage,
+            pages.TrainingPage, pages.LogPage, pages.EvaluationPage, pages.ExportPage
         ]
 
         for PageClass in page_classes:
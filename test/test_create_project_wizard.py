@@ -0,0 +1,215 @@
+"""
+测试创建项目向导
+"""
+
+import pytest
+import sys
+
+from PySide6.QtWidgets import QApplication, QCheckBox
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+
+from yoloflow.model.enums import TaskType
+from yoloflow.ui.create_project_wizard import CreateProjectWizard, TaskCard
+from yoloflow.ui.dataset_config_dialog import DatasetConfigDialog
+
+
+@pytest.fixture
+def app():
+    """创建QApplication实例"""
+    if not QApplication.instance():
+        app = QApplication(sys.argv)
+    else:
+        app = QApplication.instance()
+    yield app
+
+
+@pytest.fixture
+def wizard(app):
+    """创建CreateProjectWizard实例"""
+    wizard = CreateProjectWizard()
+    yield wizard
+    wizard.close()
+
+
+class TestModelList:
+    """测试模型列表"""
+
+    @pytest.fixture(autouse=True)
+    def build_model_page(self, wizard):
+        """创建延迟构建的模型配置页面"""
+        wizard._ensure_page_built(3)
+
+    def test_model_widgets_reused_for_same_task(self, wizard):
+        """测试同一任务类型重复进入时复用控件"""
+        wizard.selected_task_type = TaskType.DETECTION
+        wizard._update_model_list()
+        widgets = wizard._model_widgets_by_task[TaskType.DETECTION]
+        assert widgets
+
+        wizard._update_model_list()
+        assert wizard._model_widgets_by_task[TaskType.DETECTION] is widgets
+
+    def test_switching_task_hides_previous_widgets(self, wizard):
+        """测试切换任务类型时隐藏之前的控件"""
+        wizard.selected_task_type = TaskType.DETECTION
+        wizard._update_model_list()
+        detection_widgets = wizard._model_widgets_by_task[TaskType.DETECTION]
+
+        wizard.selected_task_type = TaskType.CLASSIFICATION
+        wizard._update_model_list()
+
+        assert all(w.isHidden() for w in detection_widgets)
+        assert not any(
+            w.isHidden() for w in wizard._model_widgets_by_task[TaskType.CLASSIFICATION])
+
+    def test_cached_checkboxes_follow_selection(self, wizard):
+        """测试复用的多选框与已选择模型保持一致"""
+        wizard.selected_task_type = TaskType.DETECTION
+        wizard._update_model_list()
+        checkbox = next(w for w in wizard._model_widgets_by_task[TaskType.DETECTION]
+                        if isinstance(w, QCheckBox))
+        checkbox.setChecked(True)
+        assert len(wizard.selected_models) == 1
+
+        # 切换任务类型会清空选择
+        wizard.selected_task_type = TaskType.CLASSIFICATION
+        wizard._selected_models.clear()
+        wizard._update_model_list()
+
+        wizard.selected_task_type = TaskType.DETECTION
+        wizard._update_model_list()
+        assert not checkbox.isChecked()
+        assert wizard.selected_models == []
+
+
+class TestProjectInfo:
+    """测试项目信息页面"""
+
+    @pytest.fixture(autouse=True)
+    def build_project_info_page(self, wizard):
+        """创建延迟构建的项目信息页面"""
+        wizard.tab_widget.setCurrentIndex(1)
+
+    def test_project_info_read_from_fields(self, wizard):
+        """测试项目信息直接从输入框读取"""
+        wizard.name_edit.setText("  demo  ")
+        wizard.path_edit.setText("/tmp/projects")
+        assert wizard.project_name == "demo"
+        assert wizard.project_path == "/tmp/projects"
+
+    def test_button_state_debounced(self, wizard):
+        """测试连续输入合并为一次状态刷新"""
+        wizard.tab_widget.setCurrentIndex(1)
+        wizard.name_edit.setText("demo")
+        wizard.path_edit.setText("/tmp/projects")
+        assert wizard._state_timer.isActive()
+        assert not wizard.next_button.isEnabled()
+
+        QTest.qWait(wizard._state_timer.interval() + 50)
+        assert not wizard._state_timer.isActive()
+        assert wizard.next_button.isEnabled()
+        assert "demo" in wizard.full_path_label.text()
+        assert wizard.full_path_label.property("state") == "ok"
+
+
+class TestTaskTypePage:
+    """测试项目类型页面"""
+
+    def test_card_click_selects_task(self, wizard):
+        """测试点击卡片选中对应任务类型"""
+        card = wizard.findChildren(TaskCard)[1]
+        QTest.mouseClick(card, Qt.MouseButton.LeftButton)
+
+        assert wizard.selected_task_type == wizard.task_provider.get_all_tasks()[1].task_type
+        assert wizard.next_button.isEnabled()
+
+
+class TestLazyPages:
+    """测试延迟创建的Tab页面"""
+
+    def test_pages_built_on_first_visit(self, wizard):
+        """测试除首页外的页面在首次进入时才创建"""
+        assert wizard.project_name == ""
+        assert not hasattr(wizard, "dataset_table")
+        assert not hasattr(wizard, "model_list_layout")
+
+        wizard.tab_widget.setCurrentIndex(2)
+        table = wizard.dataset_table
+        wizard.tab_widget.setCurrentIndex(3)
+        assert hasattr(wizard, "model_list_layout")
+
+        wizard.tab_widget.setCurrentIndex(2)
+        assert wizard.dataset_table is table
+
+
+class TestDatasetConfig:
+    """测试数据集配置页面"""
+
+    def test_dataset_dialog_reused(self, wizard, tmp_path, monkeypatch):
+        """测试多次添加数据集时复用同一个对话框"""
+        def fake_exec(dialog):
+            assert dialog.name_edit.text() == ""
+            dialog.name_edit.setText("data")
+            dialog.path_edit.setText(str(tmp_path))
+            return DatasetConfigDialog.DialogCode.Accepted
+
+        monkeypatch.setattr(DatasetConfigDialog, "exec", fake_exec)
+        wizard.selected_task_type = TaskType.DETECTION
+        wizard.tab_widget.setCurrentIndex(2)
+
+        wizard._add_dataset()
+        dialog = wizard._dataset_dialog
+        wizard._add_dataset()
+
+        assert wizard._dataset_dialog is dialog
+        assert len(wizard.datasets) == 2
+        assert wizard.dataset_table.rowCount() == 2
+
+    def test_remove_dataset_row_after_shift(self, wizard, tmp_path, monkeypatch):
+        """测试删除前面的行后，删除按钮仍然删除自己所在的行"""
+        names = iter(["a", "b", "c"])
+
+        def fake_exec(dialog):
+            dialog.name_edit.setText(next(names))
+            dialog.path_edit.setText(str(tmp_path))
+            return DatasetConfigDialog.DialogCode.Accepted
+
+        monkeypatch.setattr(DatasetConfigDialog, "exec", fake_exec)
+        wizard.selected_task_type = TaskType.DETECTION
+        wizard.tab_widget.setCurrentIndex(2)
+        for _ in range(3):
+            wizard._add_dataset()
+
+        last_button = wizard.dataset_table.cellWidget(2, 5)
+        wizard.dataset_table.cellWidget(0, 5).click()
+        last_button.click()
+
+        assert [d.name for d in wizard.datasets] == ["b"]
+        assert wizard.dataset_table.rowCount() == 1
+        assert wizard.dataset_table.item(0, 0).text() == "b"
+
+
+class TestCreateProject:
+    """测试创建项目"""
+
+    def test_project_created_in_background(self, wizard, tmp_path):
+        """测试项目在后台线程中创建完成后发出信号"""
+        created = []
+        wizard.project_created.connect(created.append)
+        wizard.selected_task_type = TaskType.DETECTION
+        wizard.tab_widget.setCurrentIndex(1)
+        wizard.name_edit.setText("demo")
+        wizard.path_edit.setText(str(tmp_path))
+        wizard.tab_widget.setCurrentIndex(3)
+
+        wizard._create_project()
+        assert not wizard.cancel_button.isEnabled()
+
+        for _ in range(100):
+            if created:
+                break
+            QTest.qWait(50)
+
+        assert created == [str((tmp_path / "demo").resolve())]
+        assert (tmp_path / "demo").is_dir()
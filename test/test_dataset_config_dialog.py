@@ -0,0 +1,98 @@
+"""
+测试数据集配置对话框
+"""
+
+import pytest
+import sys
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtTest import QTest
+
+from yoloflow.model.enums import TaskType
+from yoloflow.ui import dataset_config_dialog
+from yoloflow.ui.dataset_config_dialog import DatasetConfigDialog
+
+
+@pytest.fixture
+def app():
+    """创建QApplication实例"""
+    if not QApplication.instance():
+        app = QApplication(sys.argv)
+    else:
+        app = QApplication.instance()
+    yield app
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    """记录验证警告而不弹出对话框"""
+    messages = []
+    monkeypatch.setattr(dataset_config_dialog, "show_warning_message",
+                        lambda parent, title, message: messages.append(message))
+    yield messages
+
+
+@pytest.fixture
+def dialog(app):
+    """创建DatasetConfigDialog实例"""
+    dialog = DatasetConfigDialog(TaskType.DETECTION)
+    dialog.name_edit.setText("data")
+    yield dialog
+    dialog.close()
+
+
+def validate(dialog):
+    """触发验证并等待后台检查完成"""
+    dialog._validate_and_accept()
+    for _ in range(100):
+        if dialog._validation_worker is None:
+            break
+        QTest.qWait(20)
+    assert dialog._validation_worker is None
+
+
+class TestValidation:
+    """测试路径验证"""
+
+    def test_missing_path(self, dialog, warnings, tmp_path):
+        """测试路径不存在"""
+        dialog.path_edit.setText(str(tmp_path / "missing"))
+        validate(dialog)
+        assert warnings == ["所选择的数据集路径不存在"]
+
+    def test_empty_folder(self, dialog, warnings, tmp_path):
+        """测试空文件夹"""
+        dialog.path_edit.setText(str(tmp_path))
+        validate(dialog)
+        assert warnings == ["所选择的数据集文件夹为空"]
+
+    def test_unsupported_file(self, dialog, warnings, tmp_path):
+        """测试不支持的文件格式"""
+        file_path = tmp_path / "data.txt"
+        file_path.write_text("x")
+        dialog.path_edit.setText(str(file_path))
+        validate(dialog)
+        assert len(warnings) == 1
+        assert "压缩包格式" in warnings[0]
+
+    def test_valid_folder_and_archive(self, dialog, warnings, tmp_path):
+        """测试有效的文件夹和压缩包"""
+        archive = tmp_path / "DATA.ZIP"
+        archive.write_bytes(b"")
+        dialog.path_edit.setText(str(tmp_path))
+        validate(dialog)
+        dialog.path_edit.setText(str(archive))
+        validate(dialog)
+        assert warnings == []
+        assert dialog.result() == DatasetConfigDialog.DialogCode.Accepted
+
+    def test_cancelled_validation_ignored(self, dialog, warnings, tmp_path):
+        """测试取消对话框后忽略仍在进行的验证结果"""
+        dialog.path_edit.setText(str(tmp_path / "missing"))
+        dialog._validate_and_accept()
+        assert not dialog.ok_button.isEnabled()
+
+        dialog.reject()
+        assert dialog.ok_button.isEnabled()
+        QTest.qWait(200)
+        assert warnings == []
@@ -0,0 +1,41 @@
+"""
+测试数据集页面
+"""
+
+import pytest
+import sys
+
+from PySide6.QtWidgets import QApplication, QLabel
+
+from yoloflow.ui.pages.dataset_page import DatasetPage
+
+
+@pytest.fixture
+def app():
+    """创建QApplication实例"""
+    if not QApplication.instance():
+        app = QApplication(sys.argv)
+    else:
+        app = QApplication.instance()
+    yield app
+
+
+@pytest.fixture
+def page(app):
+    """创建DatasetPage实例"""
+    page = DatasetPage(None, None)
+    yield page
+    page.close()
+
+
+class TestDatasetCard:
+    """测试数据集卡片"""
+
+    def test_cards_share_page_stylesheet(self, page):
+        """测试卡片不再各自设置样式表"""
+        cards = page.grid_widget.cards
+        assert cards
+        for card in cards:
+            assert card.styleSheet() == ""
+            assert all(label.styleSheet() == "" for label in card.findChildren(QLabel))
+        assert "DatasetCard" in page.dataset_list_page.styleSheet()
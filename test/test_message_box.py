@@ -0,0 +1,62 @@
+"""
+测试深色主题MessageBox
+"""
+
+import pytest
+import sys
+
+from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
+from shiboken6 import delete
+
+from yoloflow.ui.components import message_box
+from yoloflow.ui.components.message_box import show_warning_message, show_critical_message
+
+
+@pytest.fixture
+def app():
+    """创建QApplication实例"""
+    if not QApplication.instance():
+        app = QApplication(sys.argv)
+    else:
+        app = QApplication.instance()
+    yield app
+
+
+@pytest.fixture
+def shown(app, monkeypatch):
+    """记录弹出的对话框而不进入模态循环"""
+    boxes = []
+    monkeypatch.setattr(QMessageBox, "exec", lambda box: boxes.append(box) or 0)
+    monkeypatch.setattr(message_box, "_message_boxes", {})
+    yield boxes
+
+
+class TestMessageBoxReuse:
+    """测试对话框复用"""
+
+    def test_same_severity_reuses_box(self, shown):
+        """测试同类型对话框复用同一实例并更新内容"""
+        parent = QWidget()
+        show_warning_message(parent, "标题1", "内容1")
+        show_warning_message(parent, "标题2", "内容2")
+        show_critical_message(parent, "错误", "内容3")
+
+        assert shown[0] is shown[1]
+        assert shown[2] is not shown[0]
+        assert shown[1].windowTitle() == "标题2"
+        assert shown[1].text() == "内容2"
+        assert shown[2].property("severity") == "critical"
+
+    def test_box_follows_parent(self, shown):
+        """测试切换父窗口以及父窗口销毁后重新创建"""
+        first, second = QWidget(), QWidget()
+        show_warning_message(first, "标题", "内容")
+        show_warning_message(second, "标题", "内容")
+        assert shown[1] is shown[0]
+        assert shown[1].parentWidget() is second
+        assert shown[1].isWindow()
+
+        delete(second)
+        show_warning_message(first, "标题", "内容")
+        assert shown[2].parentWidget() is first
+        assert shown[2].text() == "内容"
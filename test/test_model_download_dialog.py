@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTimer
 
+from yoloflow.ui import model_download_dialog
 from yoloflow.ui.model_download_dialog import ModelDownloadDialog, DownloadWorker, show_model_download_dialog
 
 
@@ -55,6 +56,68 @@ class TestDownloadWorker:
         
         assert worker._cancelled
 
+    def test_worker_throttles_progress(self, tmp_path):
+        """测试大量数据块只产生少量进度信号，且最终进度为100"""
+        chunks = [b"x" * 10] * 1000
+        response = Mock(status_code=200, headers={'content-length': str(10 * len(chunks))})
+        response.iter_content.return_value = iter(chunks)
+
+        output_path = tmp_path / "model.pt"
+        worker = DownloadWorker("https://example.com/model.pt", output_path, "model.pt")
+        progress, finished = [], []
+        worker.progress_updated.connect(progress.append)
+        worker.download_finished.connect(lambda ok, msg: finished.append(ok))
+
+        session = Mock()
+        session.get.return_value = response
+        with patch.object(model_download_dialog, '_get_session', return_value=session):
+            worker.run()
+
+        session.get.assert_called_once()
+        assert finished == [True]
+        assert output_path.stat().st_size == 10 * len(chunks)
+        assert len(progress) < len(chunks)
+        assert progress[-1] == 100
+
+    def test_worker_resumes_partial_download(self, tmp_path):
+        """测试从已下载的部分文件续传"""
+        output_path = tmp_path / "model.pt"
+        (tmp_path / "model.pt.part").write_bytes(b"hello")
+        response = Mock(status_code=206, headers={'content-length': '6'})
+        response.iter_content.return_value = iter([b" world"])
+        session = Mock()
+        session.get.return_value = response
+
+        worker = DownloadWorker("https://example.com/model.pt", output_path, "model.pt")
+        finished = []
+        worker.download_finished.connect(lambda ok, msg: finished.append(ok))
+        with patch.object(model_download_dialog, '_get_session', return_value=session):
+            worker.run()
+
+        assert finished == [True]
+        assert session.get.call_args.kwargs['headers'] == {'Range': 'bytes=5-'}
+        assert output_path.read_bytes() == b"hello world"
+        assert not (tmp_path / "model.pt.part").exists()
+
+    def test_worker_reports_unknown_size(self, tmp_path):
+        """测试服务器未返回文件大小时仍能下载并报告已下载的字节数"""
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = iter([b"data"])
+        session = Mock()
+        session.get.return_value = response
+
+        worker = DownloadWorker("https://example.com/model.pt", tmp_path / "model.pt", "model.pt")
+        unknown, progress, status = [], [], []
+        worker.size_unknown.connect(lambda: unknown.append(True))
+        worker.progress_updated.connect(progress.append)
+        worker.status_updated.connect(status.append)
+        with patch.object(model_download_dialog, '_get_session', return_value=session):
+            worker.run()
+
+        assert unknown == [True]
+        assert progress == [100]
+        assert any(text.endswith("MB") and "/" not in text for text in status)
+
 
 class TestModelDownloadDialog:
     """测试模型下载对话框"""
@@ -106,6 +169,27 @@ class TestModelDownloadDialog:
         assert download_dialog.status_label.text() == "下载成功"
         assert download_dialog.progress_bar.value() == 100
     
+    def test_size_unknown_switches_to_busy_indicator(self, download_dialog):
+        """测试文件大小未知时进度条切换为不确定模式，完成后恢复"""
+        download_dialog.is_downloading = True
+        download_dialog._on_size_unknown()
+        assert download_dialog.progress_bar.maximum() == 0
+
+        download_dialog._on_download_finished(True, "下载成功")
+        assert download_dialog.progress_bar.maximum() == 100
+        assert download_dialog.progress_bar.value() == 100
+
+    def test_download_finished_releases_worker(self, download_dialog):
+        """测试下载完成后释放下载线程"""
+        worker = Mock()
+        download_dialog.download_worker = worker
+        download_dialog.is_downloading = True
+
+        download_dialog._on_download_finished(True, "下载成功")
+
+        worker.wait.assert_called_once()
+        assert download_dialog.download_worker is None
+
     def test_download_finished_failure(self, download_dialog):
         """测试下载失败"""
         download_dialog.is_downloading = True
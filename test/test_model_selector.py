@@ -153,6 +153,25 @@ class TestModelSelector:
         for model in classification_models:
             assert model.supports_task(TaskType.CLASSIFICATION)
     
+    def test_get_models_for_task_cache(self, selector):
+        """Test cached task lookups stay in sync with registrations."""
+        detection_models = selector.get_models_for_task(TaskType.DETECTION)
+        
+        # Mutating the returned list must not affect the cache
+        detection_models.clear()
+        assert len(selector.get_models_for_task(TaskType.DETECTION)) > 0
+        
+        # Registering a model invalidates the cached result
+        initial_count = len(selector.get_models_for_task(TaskType.DETECTION))
+        selector.register_model(ModelInfo(
+            name="Cached Detection Model",
+            filename="cached-detect.pt",
+            parameters="1.0M",
+            supported_tasks=frozenset({TaskType.DETECTION}),
+            description="Model registered after lookup"
+        ))
+        assert len(selector.get_models_for_task(TaskType.DETECTION)) == initial_count + 1
+    
     def test_get_model_by_filename(self, selector):
         """Test retrieving model by filename."""
         # Test with known default model
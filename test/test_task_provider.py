@@ -153,6 +153,20 @@ class TestTaskTypeProvider:
         for i, expected_type in enumerate(expected_order):
             assert all_tasks[i].task_type == expected_type
     
+    def test_get_all_tasks_cache(self, provider):
+        """Test cached task list stays in sync with the registry."""
+        all_tasks = provider.get_all_tasks()
+        
+        # Mutating the returned list must not affect the cache
+        all_tasks.clear()
+        assert len(provider.get_all_tasks()) == 6
+        
+        # Removing a task invalidates the cached list
+        provider.remove_task(TaskType.KEYPOINT)
+        task_types = [task.task_type for task in provider.get_all_tasks()]
+        assert TaskType.KEYPOINT not in task_types
+        assert len(task_types) == 5
+    
     def test_get_task_names(self, provider):
         """Test getting task display names."""
         names = provider.get_task_names()